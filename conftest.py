@@ -14,6 +14,17 @@ except ImportError:
 else:
     faulthandler.enable()
 
+# Run the suite on uvloop when it is available.  Tornado creates its IOLoops
+# on top of asyncio, so gen_cluster tests pick up the policy as well.
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 def pytest_addoption(parser):
     parser.addoption("--runslow", action="store_true", help="run slow tests")
@@ -1,11 +1,8 @@
-from __future__ import print_function, division, absolute_import
-
 import atexit
 import logging
 import multiprocessing
 import gc
 import os
-from sys import exit
 import warnings
 
 import click
@@ -21,9 +18,9 @@ from distributed.proctitle import (
     enable_proctitle_on_current,
 )
 
-from toolz import valmap
 from tornado.ioloop import IOLoop, TimeoutError
 from tornado import gen
+from tornado.locks import Semaphore
 
 logger = logging.getLogger("distributed.dask_worker")
 
@@ -219,8 +216,25 @@ def main(
     tls_key,
     dashboard_address,
 ):
+    err = _validate(nprocs, worker_port, nanny, contact_address, listen_address, host)
+    if err:
+        raise click.UsageError("Failed to launch worker.  " + err)
+
+    try:
+        if listen_address:
+            (host, worker_port) = get_address_host_port(listen_address, strict=True)
+
+        if contact_address:
+            # we only need this to verify it is getting parsed
+            (_, _) = get_address_host_port(contact_address, strict=True)
+        else:
+            # if contact address is not present we use the listen_address for contact
+            contact_address = listen_address
+    except ValueError as e:
+        raise click.UsageError("Failed to launch worker.  " + str(e))
+
     g0, g1, g2 = gc.get_threshold()  # https://github.com/dask/distributed/issues/1653
-    gc.set_threshold(g0 * 3, g1 * 3, g2 * 3)
+    gc.set_threshold(g0 * 3, g1 * 3, g2 * 10)
 
     enable_proctitle_on_current()
     enable_proctitle_on_children()
@@ -249,60 +263,19 @@ def main(
         }
     )
 
-    if nprocs > 1 and worker_port != 0:
-        logger.error(
-            "Failed to launch worker.  You cannot use the --port argument when nprocs > 1."
-        )
-        exit(1)
-
-    if nprocs > 1 and not nanny:
-        logger.error(
-            "Failed to launch worker.  You cannot use the --no-nanny argument when nprocs > 1."
-        )
-        exit(1)
-
-    if contact_address and not listen_address:
-        logger.error(
-            "Failed to launch worker. "
-            "Must specify --listen-address when --contact-address is given"
-        )
-        exit(1)
-
-    if nprocs > 1 and listen_address:
-        logger.error(
-            "Failed to launch worker. "
-            "You cannot specify --listen-address when nprocs > 1."
-        )
-        exit(1)
-
-    if (worker_port or host) and listen_address:
-        logger.error(
-            "Failed to launch worker. "
-            "You cannot specify --listen-address when --worker-port or --host is given."
-        )
-        exit(1)
-
-    try:
-        if listen_address:
-            (host, worker_port) = get_address_host_port(listen_address, strict=True)
-
-        if contact_address:
-            # we only need this to verify it is getting parsed
-            (_, _) = get_address_host_port(contact_address, strict=True)
-        else:
-            # if contact address is not present we use the listen_address for contact
-            contact_address = listen_address
-    except ValueError as e:
-        logger.error("Failed to launch worker. " + str(e))
-        exit(1)
-
     if nanny:
         port = nanny_port
     else:
         port = worker_port
 
+    try:
+        # Respect CPU affinity, e.g. when pinned by a batch scheduler or cgroup
+        ncpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        ncpus = multiprocessing.cpu_count()
+
     if not nthreads:
-        nthreads = multiprocessing.cpu_count() // nprocs
+        nthreads = ncpus // nprocs or 1
 
     if pid_file:
         with open(pid_file, "w") as f:
@@ -317,9 +290,11 @@ def main(
     services = {}
 
     if resources:
-        resources = resources.replace(",", " ").split()
-        resources = dict(pair.split("=") for pair in resources)
-        resources = valmap(float, resources)
+        resources = {
+            k: float(v)
+            for pair in resources.replace(",", " ").split()
+            for k, v in [pair.split("=", 1)]
+        }
     else:
         resources = None
 
@@ -375,20 +350,32 @@ def main(
         for i in range(nprocs)
     ]
 
+    # Move long-lived startup objects out of the way of future collections
+    if hasattr(gc, "freeze"):  # Python 3.7+
+        gc.collect()
+        gc.freeze()
+
     @gen.coroutine
     def close_all():
         # Unregister all workers from scheduler
         if nanny:
-            yield [n.close(timeout=2) for n in nannies]
+            yield gen.multi([n.close(timeout=2) for n in nannies])
 
     def on_signal(signum):
         logger.info("Exiting on signal %d", signum)
-        close_all()
+        return close_all()
+
+    # Don't swamp the machine (or the forkserver) with simultaneous spawns
+    starting = Semaphore(min(nprocs, ncpus))
+
+    async def start(n):
+        async with starting:
+            await n
 
     @gen.coroutine
     def run():
-        yield nannies
-        yield [n.finished() for n in nannies]
+        yield gen.multi([start(n) for n in nannies], quiet_exceptions=TimeoutError)
+        yield gen.multi([n.finished() for n in nannies])
 
     install_signal_handlers(loop, cleanup=on_signal)
 
@@ -403,6 +390,27 @@ def main(
         logger.info("End worker")
 
 
+def _validate(nprocs, worker_port, nanny, contact_address, listen_address, host):
+    """ Check for incompatible command line options
+
+    Returns an error message, or None if the options are valid
+    """
+    if nprocs > 1 and worker_port != 0:
+        return "You cannot use the --port argument when nprocs > 1."
+    if nprocs > 1 and not nanny:
+        return "You cannot use the --no-nanny argument when nprocs > 1."
+    if contact_address and not listen_address:
+        return "Must specify --listen-address when --contact-address is given"
+    if nprocs > 1 and listen_address:
+        return "You cannot specify --listen-address when nprocs > 1."
+    if (worker_port or host) and listen_address:
+        return (
+            "You cannot specify --listen-address when --worker-port or --host "
+            "is given."
+        )
+    return None
+
+
 def go():
     check_python_3()
     main()
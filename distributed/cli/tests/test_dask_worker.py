@@ -6,6 +6,7 @@ from click.testing import CliRunner
 pytest.importorskip("requests")
 
 import requests
+import gc
 import sys
 import os
 from time import sleep
@@ -179,6 +180,20 @@ def test_nprocs_requires_nanny(loop):
             )
 
 
+def test_invalid_options_are_usage_errors():
+    thresholds = gc.get_threshold()
+    runner = CliRunner()
+    result = runner.invoke(
+        distributed.cli.dask_worker.main,
+        ["127.0.0.1:8786", "--nprocs=2", "--listen-address=tcp://127.0.0.1:9000"],
+    )
+    assert result.exit_code == 2
+    assert "Failed to launch worker" in result.output
+    assert "--listen-address when nprocs > 1" in result.output
+    # Rejected before touching process-wide state
+    assert gc.get_threshold() == thresholds
+
+
 def test_nprocs_expands_name(loop):
     with popen(["dask-scheduler", "--no-dashboard"]) as sched:
         with popen(
@@ -168,6 +168,8 @@ class Future(WrappedKey):
     Client:  Creates futures
     """
 
+    __slots__ = ("_cleared", "client", "_generation", "_state", "__weakref__")
+
     _cb_executor = None
     _cb_executor_pid = None
 
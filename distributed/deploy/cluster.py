@@ -21,6 +21,30 @@ from ..utils import (
 logger = logging.getLogger(__name__)
 
 
+_WIDGET_STATUS_TEMPLATE = """
+<div>
+  <style scoped>
+    .dataframe tbody tr th:only-of-type {{
+        vertical-align: middle;
+    }}
+
+    .dataframe tbody tr th {{
+        vertical-align: top;
+    }}
+
+    .dataframe thead th {{
+        text-align: right;
+    }}
+  </style>
+  <table style="text-align: right;">
+    <tr><th>Workers</th> <td>{workers}</td></tr>
+    <tr><th>Cores</th> <td>{cores}</td></tr>
+    <tr><th>Memory</th> <td>{memory}</td></tr>
+  </table>
+</div>
+"""
+
+
 class Cluster(object):
     """ Superclass for cluster objects
 
@@ -85,7 +109,13 @@ class Cluster(object):
 
     @property
     def dashboard_link(self):
-        host = self.scheduler.address.split("://")[1].split(":")[0]
+        address = self.scheduler.address
+        cached = getattr(self, "_dashboard_host", None)
+        if cached is not None and cached[0] == address:
+            host = cached[1]
+        else:
+            host = address.split("://", 1)[1].split(":", 1)[0]
+            self._dashboard_host = (address, host)
         port = self.scheduler.services["dashboard"].port
         return format_dashboard_link(host, port)
 
@@ -120,44 +150,27 @@ class Cluster(object):
                 self.scheduler.loop.add_callback(self.scale_down, to_close)
 
     def _widget_status(self):
-        workers = len(self.scheduler.workers)
-        cores = sum(ws.nthreads for ws in self.scheduler.workers.values())
-        memory = sum(ws.memory_limit for ws in self.scheduler.workers.values())
-        memory = format_bytes(memory)
-        text = """
-<div>
-  <style scoped>
-    .dataframe tbody tr th:only-of-type {
-        vertical-align: middle;
-    }
-
-    .dataframe tbody tr th {
-        vertical-align: top;
-    }
-
-    .dataframe thead th {
-        text-align: right;
-    }
-  </style>
-  <table style="text-align: right;">
-    <tr><th>Workers</th> <td>%d</td></tr>
-    <tr><th>Cores</th> <td>%d</td></tr>
-    <tr><th>Memory</th> <td>%s</td></tr>
-  </table>
-</div>
-""" % (
-            workers,
-            cores,
-            memory,
+        workers = self.scheduler.workers
+        cores = 0
+        memory = 0
+        for ws in workers.values():
+            cores += ws.nthreads
+            memory += ws.memory_limit
+        cached = getattr(self, "_widget_status_memory", None)
+        if cached is not None and cached[0] == memory:
+            memory_text = cached[1]
+        else:
+            memory_text = format_bytes(memory)
+            self._widget_status_memory = (memory, memory_text)
+        return _WIDGET_STATUS_TEMPLATE.format_map(
+            {"workers": len(workers), "cores": cores, "memory": memory_text}
         )
-        return text
 
     def _widget(self):
         """ Create IPython widget for display within a notebook """
-        try:
-            return self._cached_widget
-        except AttributeError:
-            pass
+        widget = getattr(self, "_cached_widget", None)
+        if widget is not None:
+            return widget
 
         from ipywidgets import Layout, VBox, HBox, IntText, Button, HTML, Accordion
 
@@ -216,6 +229,10 @@ class Cluster(object):
         def update():
             status.value = self._widget_status()
 
+        # Never leave an earlier callback re-rendering a stale widget forever
+        old = self.scheduler.periodic_callbacks.pop("cluster-repr", None)
+        if old is not None:
+            old.stop()
         pc = PeriodicCallback(update, 500, io_loop=self.scheduler.loop)
         self.scheduler.periodic_callbacks["cluster-repr"] = pc
         pc.start()
@@ -227,12 +244,10 @@ class Cluster(object):
 
     @property
     def asynchronous(self):
-        return (
-            self._asynchronous
-            or getattr(thread_state, "asynchronous", False)
-            or hasattr(self.loop, "_thread_identity")
-            and self.loop._thread_identity == get_thread_identity()
-        )
+        if self._asynchronous or getattr(thread_state, "asynchronous", False):
+            return True
+        ident = getattr(self.loop, "_thread_identity", None)
+        return ident is not None and ident == get_thread_identity()
 
     def sync(self, func, *args, asynchronous=None, callback_timeout=None, **kwargs):
         asynchronous = asynchronous or self.asynchronous
@@ -1,11 +1,7 @@
-from __future__ import print_function, division, absolute_import
-
-from collections import defaultdict, deque
-from datetime import timedelta
 import logging
 import uuid
+import weakref
 
-from tornado import gen
 import tornado.locks
 
 from .client import _get_global_client
@@ -14,6 +10,9 @@ from .worker import get_worker
 
 logger = logging.getLogger(__name__)
 
+# Locks currently held by this process, by scheduler address and lock name
+_held_locks = weakref.WeakValueDictionary()
+
 
 class LockExtension(object):
     """ An extension for the scheduler to manage Locks
@@ -26,7 +25,8 @@ class LockExtension(object):
 
     def __init__(self, scheduler):
         self.scheduler = scheduler
-        self.events = defaultdict(deque)
+        self.conditions = dict()
+        self.waiters = dict()
         self.ids = dict()
 
         self.scheduler.handlers.update(
@@ -37,27 +37,31 @@ class LockExtension(object):
 
     async def acquire(self, stream=None, name=None, id=None, timeout=None):
         with log_errors():
-            if isinstance(name, list):
+            # msgpack deserializes tuple names as lists
+            if type(name) is list:
                 name = tuple(name)
-            if name not in self.ids:
-                result = True
-            else:
-                while name in self.ids:
-                    event = tornado.locks.Event()
-                    self.events[name].append(event)
-                    future = event.wait()
-                    if timeout is not None:
-                        future = gen.with_timeout(timedelta(seconds=timeout), future)
-                    try:
-                        await future
-                    except gen.TimeoutError:
+            result = True
+            deadline = None
+            while name in self.ids:
+                if timeout is not None and deadline is None:
+                    deadline = self.scheduler.loop.time() + timeout
+                condition = self.conditions.get(name)
+                if condition is None:
+                    condition = self.conditions[name] = tornado.locks.Condition()
+                    self.waiters[name] = 0
+                self.waiters[name] += 1
+                try:
+                    if timeout is None:
+                        await condition.wait()
+                    elif not await condition.wait(timeout=deadline):
                         result = False
                         break
-                    else:
-                        result = True
-                    finally:
-                        event2 = self.events[name].popleft()
-                        assert event is event2
+                finally:
+                    # Forget the condition once nobody is waiting on it
+                    self.waiters[name] -= 1
+                    if not self.waiters[name]:
+                        del self.waiters[name]
+                        del self.conditions[name]
             if result:
                 assert name not in self.ids
                 self.ids[name] = id
@@ -65,15 +69,15 @@ class LockExtension(object):
 
     def release(self, stream=None, name=None, id=None):
         with log_errors():
-            if isinstance(name, list):
+            if type(name) is list:
                 name = tuple(name)
             if self.ids.get(name) != id:
                 raise ValueError("This lock has not yet been acquired")
             del self.ids[name]
-            if self.events[name]:
-                self.scheduler.loop.add_callback(self.events[name][0].set)
-            else:
-                del self.events[name]
+            condition = self.conditions.get(name)
+            if condition is not None:
+                # Wake up the longest waiting acquirer
+                condition.notify(1)
 
 
 class Lock(object):
@@ -96,6 +100,8 @@ class Lock(object):
     def __init__(self, name=None, client=None):
         self.client = client or _get_global_client() or get_worker().client
         self.name = name or "lock-" + uuid.uuid4().hex
+        # The scheduler also receives tuples as lists, see LockExtension
+        self._hashable_name = tuple(name) if isinstance(name, list) else self.name
         self.id = uuid.uuid4().hex
         self._locked = False
 
@@ -125,25 +131,42 @@ class Lock(object):
                 raise ValueError("can't specify a timeout for a non-blocking call")
             timeout = 0
 
-        result = self.client.sync(
-            self.client.scheduler.lock_acquire,
-            name=self.name,
-            id=self.id,
-            timeout=timeout,
-        )
+        result = self.client.sync(self._acquire, timeout=timeout)
         self._locked = True
         return result
 
+    async def _acquire(self, timeout=None):
+        key = self._key()
+        if timeout == 0 and key in _held_locks:
+            # Held by this process, so the scheduler would refuse it anyway
+            return False
+        result = await self.client.scheduler.lock_acquire(
+            name=self.name, id=self.id, timeout=timeout
+        )
+        if result:
+            _held_locks[key] = self
+        return result
+
+    def _key(self):
+        return (self.client.scheduler.address, self._hashable_name)
+
     def release(self):
         """ Release the lock if already acquired """
         if not self.locked():
             raise ValueError("Lock is not yet acquired")
-        result = self.client.sync(
-            self.client.scheduler.lock_release, name=self.name, id=self.id
-        )
+        result = self.client.sync(self._release)
         self._locked = False
         return result
 
+    async def _release(self):
+        key = self._key()
+        try:
+            return await self.client.scheduler.lock_release(name=self.name, id=self.id)
+        finally:
+            # Even if the scheduler refused, stop answering for it locally
+            if _held_locks.get(key) is self:
+                del _held_locks[key]
+
     def locked(self):
         return self._locked
 
@@ -155,11 +178,15 @@ class Lock(object):
         self.release()
 
     async def __aenter__(self):
-        await self.acquire()
+        await self._acquire()
+        self._locked = True
         return self
 
     async def __aexit__(self, *args, **kwargs):
-        await self.release()
+        if not self.locked():
+            raise ValueError("Lock is not yet acquired")
+        await self._release()
+        self._locked = False
 
     def __reduce__(self):
         return (Lock, (self.name,))
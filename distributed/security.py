@@ -1,3 +1,6 @@
+from functools import lru_cache
+import os
+
 try:
     import ssl
 except ImportError:
@@ -106,15 +109,13 @@ class Security(object):
 
     def _get_tls_context(self, tls, purpose):
         if tls.get("ca_file") and tls.get("cert"):
-            ctx = ssl.create_default_context(purpose=purpose, cafile=tls["ca_file"])
-            ctx.verify_mode = ssl.CERT_REQUIRED
-            # We expect a dedicated CA for the cluster and people using
-            # IP addresses rather than hostnames
-            ctx.check_hostname = False
-            ctx.load_cert_chain(tls["cert"], tls.get("key"))
-            if tls.get("ciphers"):
-                ctx.set_ciphers(tls.get("ciphers"))
-            return ctx
+            files = (tls["ca_file"], tls["cert"], tls.get("key"))
+            return _make_tls_context(
+                *files,
+                ciphers=tls.get("ciphers"),
+                purpose=purpose,
+                stamps=tuple(map(_file_stamp, files))
+            )
 
     def get_connection_args(self, role):
         """
@@ -137,3 +138,29 @@ class Security(object):
             "ssl_context": self._get_tls_context(tls, ssl.Purpose.CLIENT_AUTH),
             "require_encryption": self.require_encryption,
         }
+
+
+def _file_stamp(path):
+    """ Modification time of a file, to notice certificates changing on disk """
+    try:
+        return os.stat(path).st_mtime_ns
+    except (TypeError, OSError):
+        return None
+
+
+@lru_cache(maxsize=32)
+def _make_tls_context(ca_file, cert, key, ciphers, purpose, stamps):
+    """ Create an SSLContext, reusing an earlier one for the same files
+
+    Parsing the certificates is expensive and the configured context is
+    never modified afterwards, so it can be shared between callers.
+    """
+    ctx = ssl.create_default_context(purpose=purpose, cafile=ca_file)
+    ctx.verify_mode = ssl.CERT_REQUIRED
+    # We expect a dedicated CA for the cluster and people using
+    # IP addresses rather than hostnames
+    ctx.check_hostname = False
+    ctx.load_cert_chain(cert, key)
+    if ciphers:
+        ctx.set_ciphers(ciphers)
+    return ctx
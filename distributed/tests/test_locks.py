@@ -26,7 +26,8 @@ def test_lock(c, s, a, b):
 
     futures = c.map(f, range(20))
     results = yield futures
-    assert not s.extensions["locks"].events
+    assert not s.extensions["locks"].conditions
+    assert not s.extensions["locks"].waiters
     assert not s.extensions["locks"].ids
 
 
@@ -47,7 +48,8 @@ def test_timeout(c, s, a, b):
     assert stop - start < 0.3
     assert result is False
     assert locks.ids["x"] == lock.id
-    assert not locks.events["x"]
+    assert "x" not in locks.conditions
+    assert "x" not in locks.waiters
 
     yield lock.release()
 
@@ -77,6 +79,68 @@ def test_acquires_blocking(c, s, a, b):
         lock.acquire(blocking=False, timeout=1)
 
 
+@gen_cluster(client=True)
+def test_acquire_nonblocking_held_locally(c, s, a, b):
+    calls = []
+    acquire = s.handlers["lock_acquire"]
+
+    def lock_acquire(*args, **kwargs):
+        calls.append(kwargs["name"])
+        return acquire(*args, **kwargs)
+
+    s.handlers["lock_acquire"] = lock_acquire
+
+    lock = Lock("x")
+    yield lock.acquire()
+    assert calls == ["x"]
+
+    lock2 = Lock("x")
+    result = yield lock2.acquire(blocking=False)
+    assert result is False
+    assert calls == ["x"]  # answered locally, without asking the scheduler
+    assert s.extensions["locks"].ids["x"] == lock.id
+
+    yield lock.release()
+    result = yield lock2.acquire(blocking=False)
+    assert result is True
+    yield lock2.release()
+    assert not s.extensions["locks"].ids
+
+
+@gen_cluster(client=True)
+def test_failed_release_forgets_local_lock(c, s, a, b):
+    calls = []
+    acquire = s.handlers["lock_acquire"]
+
+    def lock_acquire(*args, **kwargs):
+        calls.append(kwargs["name"])
+        return acquire(*args, **kwargs)
+
+    s.handlers["lock_acquire"] = lock_acquire
+
+    lock = Lock("x")
+    yield lock.acquire()
+    del s.extensions["locks"].ids["x"]  # e.g. the scheduler was restarted
+
+    with pytest.raises(ValueError):
+        yield lock.release()
+
+    lock2 = Lock("x")
+    result = yield lock2.acquire(blocking=False)
+    assert result is True
+    assert calls == ["x", "x"]
+    yield lock2.release()
+
+
+@gen_cluster(client=True)
+async def test_async_context_manager(c, s, a, b):
+    async with Lock("x") as lock:
+        assert lock.locked()
+        assert s.extensions["locks"].ids["x"] == lock.id
+    assert not lock.locked()
+    assert not s.extensions["locks"].ids
+
+
 def test_timeout_sync(client):
     with Lock("x") as lock:
         assert Lock("x").acquire(timeout=0.1) is False
@@ -113,7 +177,7 @@ def test_lock_types(c, s, a, b):
         yield lock.acquire()
         yield lock.release()
 
-    assert not s.extensions["locks"].events
+    assert not s.extensions["locks"].conditions
 
 
 @gen_cluster(client=True)
@@ -1,5 +1,6 @@
 from __future__ import print_function, division, absolute_import
 
+import asyncio
 import gc
 import logging
 import os
@@ -7,20 +8,17 @@ import random
 import sys
 import multiprocessing as mp
 
-import numpy as np
-
 import pytest
-from toolz import valmap, first
 from tornado import gen
 from tornado.ioloop import IOLoop
 
 import dask
 from distributed import Nanny, rpc, Scheduler, Worker
 from distributed.core import CommClosedError
-from distributed.metrics import time
 from distributed.protocol.pickle import dumps
 from distributed.utils import ignoring, tmpfile
 from distributed.utils_test import (  # noqa: F401
+    async_wait_for,
     gen_cluster,
     gen_test,
     inc,
@@ -30,42 +28,42 @@ from distributed.utils_test import (  # noqa: F401
 
 
 @gen_cluster(nthreads=[])
-def test_nanny(s):
-    n = yield Nanny(s.address, nthreads=2, loop=s.loop)
+async def test_nanny(s):
+    n = await Nanny(s.address, nthreads=2, loop=s.loop)
 
     with rpc(n.address) as nn:
         assert n.is_alive()
         assert s.nthreads[n.worker_address] == 2
         assert s.workers[n.worker_address].nanny == n.address
 
-        yield nn.kill()
+        await nn.kill()
         assert not n.is_alive()
         assert n.worker_address not in s.nthreads
         assert n.worker_address not in s.workers
 
-        yield nn.kill()
+        await nn.kill()
         assert not n.is_alive()
         assert n.worker_address not in s.nthreads
         assert n.worker_address not in s.workers
 
-        yield nn.instantiate()
+        await nn.instantiate()
         assert n.is_alive()
         assert s.nthreads[n.worker_address] == 2
         assert s.workers[n.worker_address].nanny == n.address
 
-        yield nn.terminate()
+        await nn.terminate()
         assert not n.is_alive()
 
-    yield n.close()
+    await n.close()
 
 
 @gen_cluster(nthreads=[])
-def test_many_kills(s):
-    n = yield Nanny(s.address, nthreads=2, loop=s.loop)
+async def test_many_kills(s):
+    n = await Nanny(s.address, nthreads=2, loop=s.loop)
     assert n.is_alive()
-    yield [n.kill() for i in range(5)]
-    yield [n.kill() for i in range(5)]
-    yield n.close()
+    await asyncio.gather(*(n.kill() for i in range(5)))
+    await asyncio.gather(*(n.kill() for i in range(5)))
+    await n.close()
 
 
 @gen_cluster(Worker=Nanny)
@@ -77,72 +75,64 @@ def test_str(s, a, b):
 
 
 @gen_cluster(nthreads=[], timeout=20, client=True)
-def test_nanny_process_failure(c, s):
-    n = yield Nanny(s.address, nthreads=2, loop=s.loop)
+async def test_nanny_process_failure(c, s):
+    n = await Nanny(s.address, nthreads=2, loop=s.loop)
     first_dir = n.worker_dir
 
     assert os.path.exists(first_dir)
 
     original_address = n.worker_address
     ww = rpc(n.worker_address)
-    yield ww.update_data(data=valmap(dumps, {"x": 1, "y": 2}))
+    await ww.update_data(data={"x": 1, "y": 2})
+    ww.close_rpc()
     pid = n.pid
     assert pid is not None
     with ignoring(CommClosedError):
-        yield c.run(os._exit, 0, workers=[n.worker_address])
+        await c.run(os._exit, 0, workers=[n.worker_address])
 
-    start = time()
-    while n.pid == pid:  # wait while process dies and comes back
-        yield gen.sleep(0.01)
-        assert time() - start < 5
-
-    start = time()
-    yield gen.sleep(1)
-    while not n.is_alive():  # wait while process comes back
-        yield gen.sleep(0.01)
-        assert time() - start < 5
+    # wait while process dies and comes back
+    await async_wait_for(lambda: n.pid != pid, timeout=5)
+    await async_wait_for(n.is_alive, timeout=5)
 
     # assert n.worker_address != original_address  # most likely
 
-    start = time()
-    while n.worker_address not in s.nthreads or n.worker_dir is None:
-        yield gen.sleep(0.01)
-        assert time() - start < 5
+    await async_wait_for(
+        lambda: n.worker_address in s.nthreads and n.worker_dir is not None, timeout=5
+    )
 
     second_dir = n.worker_dir
 
-    yield n.close()
-    assert not os.path.exists(second_dir)
-    assert not os.path.exists(first_dir)
+    await n.close()
+    parent = os.path.dirname(first_dir)
+    assert os.path.dirname(second_dir) == parent
+    remaining = set(os.listdir(parent))
+    assert os.path.basename(first_dir) not in remaining
+    assert os.path.basename(second_dir) not in remaining
     assert first_dir != n.worker_dir
-    ww.close_rpc()
     s.stop()
 
 
 @gen_cluster(nthreads=[])
-def test_run(s):
+async def test_run(s):
     pytest.importorskip("psutil")
-    n = yield Nanny(s.address, nthreads=2, loop=s.loop)
+    n = await Nanny(s.address, nthreads=2, loop=s.loop)
 
     with rpc(n.address) as nn:
-        response = yield nn.run(function=dumps(lambda: 1))
+        response = await nn.run(function=dumps(lambda: 1))
         assert response["status"] == "OK"
         assert response["result"] == 1
 
-    yield n.close()
+    await n.close()
 
 
 @pytest.mark.slow
 @gen_cluster(
     Worker=Nanny, nthreads=[("127.0.0.1", 1)], worker_kwargs={"reconnect": False}
 )
-def test_close_on_disconnect(s, w):
-    yield s.close()
+async def test_close_on_disconnect(s, w):
+    await s.close()
 
-    start = time()
-    while w.status != "closed":
-        yield gen.sleep(0.05)
-        assert time() < start + 9
+    await async_wait_for(lambda: w.status == "closed", timeout=9)
 
 
 class Something(Worker):
@@ -176,62 +166,71 @@ def test_nanny_death_timeout(s):
 
 
 @gen_cluster(client=True, Worker=Nanny)
-def test_random_seed(c, s, a, b):
-    @gen.coroutine
-    def check_func(func):
+async def test_random_seed(c, s, a, b):
+    async def check_func(func):
         x = c.submit(func, 0, 2 ** 31, pure=False, workers=a.worker_address)
         y = c.submit(func, 0, 2 ** 31, pure=False, workers=b.worker_address)
         assert x.key != y.key
-        x = yield x
-        y = yield y
+        x = await x
+        y = await y
         assert x != y
 
-    yield check_func(lambda a, b: random.randint(a, b))
-    yield check_func(lambda a, b: np.random.randint(a, b))
+    await check_func(lambda a, b: random.randint(a, b))
+    np = pytest.importorskip("numpy")
+    await check_func(lambda a, b: np.random.randint(a, b))
 
 
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="num_fds not supported on windows"
 )
 @gen_cluster(client=False, nthreads=[])
-def test_num_fds(s):
+async def test_num_fds(s):
     psutil = pytest.importorskip("psutil")
     proc = psutil.Process()
 
     # Warm up
-    w = yield Nanny(s.address)
-    yield w.close()
+    w = await Nanny(s.address)
+    await w.close()
     del w
     gc.collect()
 
     before = proc.num_fds()
 
-    for i in range(3):
-        w = yield Nanny(s.address)
-        yield gen.sleep(0.1)
-        yield w.close()
-
-    start = time()
-    while proc.num_fds() > before:
-        print("fds:", before, proc.num_fds())
-        yield gen.sleep(0.1)
-        assert time() < start + 10
+    # Collect cyclic garbage once at the end rather than during the nannies'
+    # lifetime, so file descriptors are released together before we count
+    gc.disable()
+    try:
+        nannies = await asyncio.gather(*(Nanny(s.address) for i in range(3)))
+        await asyncio.sleep(0.1)
+        await asyncio.gather(*(w.close() for w in nannies))
+        del nannies
+    finally:
+        gc.enable()
+        gc.collect()
+
+    await async_wait_for(
+        lambda: proc.num_fds() <= before,
+        timeout=10,
+        period=0.01,
+        fail_func=lambda: print("fds:", before, proc.num_fds()),
+    )
 
 
 @pytest.mark.skipif(
     not sys.platform.startswith("linux"), reason="Need 127.0.0.2 to mean localhost"
 )
 @gen_cluster(client=True, nthreads=[])
-def test_worker_uses_same_host_as_nanny(c, s):
-    for host in ["tcp://0.0.0.0", "tcp://127.0.0.2"]:
-        n = yield Nanny(s.address, host=host)
+async def test_worker_uses_same_host_as_nanny(c, s):
+    hosts = ["tcp://0.0.0.0", "tcp://127.0.0.2"]
+    nannies = await asyncio.gather(*(Nanny(s.address, host=host) for host in hosts))
 
-        def func(dask_worker):
-            return dask_worker.listener.listen_address
+    def func(dask_worker):
+        return dask_worker.listener.listen_address
 
-        result = yield c.run(func)
-        assert host in first(result.values())
-        yield n.close()
+    result = await c.run(func)
+    for host, n in zip(hosts, nannies):
+        assert host in result[n.worker_address]
+    await asyncio.gather(*(n.close() for n in nannies))
 
 
 @gen_test()
@@ -245,20 +244,17 @@ def test_scheduler_file():
 
 
 @gen_cluster(client=True, Worker=Nanny, nthreads=[("127.0.0.1", 2)])
-def test_nanny_timeout(c, s, a):
-    x = yield c.scatter(123)
+async def test_nanny_timeout(c, s, a):
+    x = await c.scatter(123)
     with captured_logger(
         logging.getLogger("distributed.nanny"), level=logging.ERROR
     ) as logger:
-        response = yield a.restart(timeout=0.1)
+        response = await a.restart(timeout=0.1)
 
     out = logger.getvalue()
     assert "timed out" in out.lower()
 
-    start = time()
-    while x.status != "cancelled":
-        yield gen.sleep(0.1)
-        assert time() < start + 7
+    await async_wait_for(lambda: x.status == "cancelled", timeout=7)
 
 
 @gen_cluster(
@@ -269,10 +265,11 @@ def test_nanny_timeout(c, s, a):
     timeout=20,
     clean_kwargs={"threads": False},
 )
-def test_nanny_terminate(c, s, a):
+async def test_nanny_terminate(c, s, a):
     from time import sleep
 
     def leak():
+        gc.disable()  # grow memory steadily, without collection pauses
         L = []
         while True:
             L.append(b"0" * 5000000)
@@ -281,10 +278,7 @@ def test_nanny_terminate(c, s, a):
     proc = a.process.pid
     with captured_logger(logging.getLogger("distributed.nanny")) as logger:
         future = c.submit(leak)
-        start = time()
-        while a.process.pid == proc:
-            yield gen.sleep(0.1)
-            assert time() < start + 10
+        await async_wait_for(lambda: a.process.pid != proc, timeout=10)
         out = logger.getvalue()
         assert "restart" in out.lower()
         assert "memory" in out.lower()
@@ -309,17 +303,14 @@ def test_avoid_memory_monitor_if_zero_limit(c, s):
 
 
 @gen_cluster(nthreads=[], client=True)
-def test_scheduler_address_config(c, s):
+async def test_scheduler_address_config(c, s):
     with dask.config.set({"scheduler-address": s.address}):
-        nanny = yield Nanny(loop=s.loop)
+        nanny = await Nanny(loop=s.loop)
         assert nanny.scheduler.address == s.address
 
-        start = time()
-        while not s.workers:
-            yield gen.sleep(0.1)
-            assert time() < start + 10
+        await async_wait_for(lambda: s.workers, timeout=10)
 
-    yield nanny.close()
+    await nanny.close()
 
 
 @pytest.mark.slow
@@ -337,21 +328,21 @@ def test_wait_for_scheduler():
 
 
 @gen_cluster(nthreads=[], client=True)
-def test_environment_variable(c, s):
+async def test_environment_variable(c, s):
     a = Nanny(s.address, loop=s.loop, memory_limit=0, env={"FOO": "123"})
     b = Nanny(s.address, loop=s.loop, memory_limit=0, env={"FOO": "456"})
-    yield [a, b]
-    results = yield c.run(lambda: os.environ["FOO"])
+    await asyncio.gather(a, b)
+    results = await c.run(lambda: os.environ["FOO"])
     assert results == {a.worker_address: "123", b.worker_address: "456"}
-    yield [a.close(), b.close()]
+    await asyncio.gather(a.close(), b.close())
 
 
 @gen_cluster(nthreads=[], client=True)
-def test_data_types(c, s):
-    w = yield Nanny(s.address, data=dict)
-    r = yield c.run(lambda dask_worker: type(dask_worker.data))
+async def test_data_types(c, s):
+    w = await Nanny(s.address, data=dict)
+    r = await c.run(lambda dask_worker: type(dask_worker.data))
     assert r[w.worker_address] == dict
-    yield w.close()
+    await w.close()
 
 
 def _noop(x):
@@ -34,6 +34,25 @@ TLS_13_CIPHERS = [
     "TLS_AES_128_CCM_8_SHA256",
 ]
 
+_ACCEPTED_CIPHERS = frozenset([FORCED_CIPHER] + TLS_13_CIPHERS)
+
+# Configuration pointing at the test certificates
+CERTS_CONFIG = {
+    "distributed.comm.tls.ca-file": ca_file,
+    "distributed.comm.tls.scheduler.key": key1,
+    "distributed.comm.tls.scheduler.cert": cert1,
+    "distributed.comm.tls.worker.cert": keycert1,
+}
+
+# Configuration with placeholder file names, for tests that never load them
+FAKE_CERTS_CONFIG = {
+    "distributed.comm.tls.ca-file": "ca.pem",
+    "distributed.comm.tls.scheduler.key": "skey.pem",
+    "distributed.comm.tls.scheduler.cert": "scert.pem",
+    "distributed.comm.tls.worker.cert": "wcert.pem",
+    "distributed.comm.tls.ciphers": FORCED_CIPHER,
+}
+
 
 def test_defaults():
     sec = Security()
@@ -65,14 +84,7 @@ def test_attribute_error():
 
 
 def test_from_config():
-    c = {
-        "distributed.comm.tls.ca-file": "ca.pem",
-        "distributed.comm.tls.scheduler.key": "skey.pem",
-        "distributed.comm.tls.scheduler.cert": "scert.pem",
-        "distributed.comm.tls.worker.cert": "wcert.pem",
-        "distributed.comm.tls.ciphers": FORCED_CIPHER,
-        "distributed.comm.require-encryption": True,
-    }
+    c = {**FAKE_CERTS_CONFIG, "distributed.comm.require-encryption": True}
 
     with dask.config.set(c):
         sec = Security()
@@ -118,14 +130,7 @@ def test_repr():
 
 
 def test_tls_config_for_role():
-    c = {
-        "distributed.comm.tls.ca-file": "ca.pem",
-        "distributed.comm.tls.scheduler.key": "skey.pem",
-        "distributed.comm.tls.scheduler.cert": "scert.pem",
-        "distributed.comm.tls.worker.cert": "wcert.pem",
-        "distributed.comm.tls.ciphers": FORCED_CIPHER,
-    }
-    with dask.config.set(c):
+    with dask.config.set(FAKE_CERTS_CONFIG):
         sec = Security()
     t = sec.get_tls_config_for_role("scheduler")
     assert t == {
@@ -152,49 +157,17 @@ def test_tls_config_for_role():
         sec.get_tls_config_for_role("supervisor")
 
 
-def test_connection_args():
-    def basic_checks(ctx):
-        assert ctx.verify_mode == ssl.CERT_REQUIRED
-        assert ctx.check_hostname is False
-
-    def many_ciphers(ctx):
-        if sys.version_info >= (3, 6):
-            assert len(ctx.get_ciphers()) > 2  # Most likely
-
-    c = {
-        "distributed.comm.tls.ca-file": ca_file,
-        "distributed.comm.tls.scheduler.key": key1,
-        "distributed.comm.tls.scheduler.cert": cert1,
-        "distributed.comm.tls.worker.cert": keycert1,
-    }
-    with dask.config.set(c):
-        sec = Security()
-
-    d = sec.get_connection_args("scheduler")
-    assert not d["require_encryption"]
-    ctx = d["ssl_context"]
-    basic_checks(ctx)
-    many_ciphers(ctx)
-
-    d = sec.get_connection_args("worker")
-    ctx = d["ssl_context"]
-    basic_checks(ctx)
-    many_ciphers(ctx)
+def basic_checks(ctx):
+    assert ctx.verify_mode == ssl.CERT_REQUIRED
+    assert ctx.check_hostname is False
 
-    # No cert defined => no TLS
-    d = sec.get_connection_args("client")
-    assert d.get("ssl_context") is None
 
-    # With more settings
-    c["distributed.comm.tls.ciphers"] = FORCED_CIPHER
-    c["distributed.comm.require-encryption"] = True
+def many_ciphers(ctx):
+    if sys.version_info >= (3, 6):
+        assert len(ctx.get_ciphers()) > 2  # Most likely
 
-    with dask.config.set(c):
-        sec = Security()
 
-    d = sec.get_listen_args("scheduler")
-    assert d["require_encryption"]
-    ctx = d["ssl_context"]
+def forced_cipher_checks(ctx):
     basic_checks(ctx)
     if sys.version_info >= (3, 6):
         supported_ciphers = ctx.get_ciphers()
@@ -205,57 +178,66 @@ def test_connection_args():
             assert len(tls_13_ciphers) == 3
 
 
-def test_listen_args():
-    def basic_checks(ctx):
-        assert ctx.verify_mode == ssl.CERT_REQUIRED
-        assert ctx.check_hostname is False
-
-    def many_ciphers(ctx):
-        if sys.version_info >= (3, 6):
-            assert len(ctx.get_ciphers()) > 2  # Most likely
-
-    c = {
-        "distributed.comm.tls.ca-file": ca_file,
-        "distributed.comm.tls.scheduler.key": key1,
-        "distributed.comm.tls.scheduler.cert": cert1,
-        "distributed.comm.tls.worker.cert": keycert1,
-    }
-    with dask.config.set(c):
+def check_tls_args(get_args):
+    with dask.config.set(CERTS_CONFIG):
         sec = Security()
 
-    d = sec.get_listen_args("scheduler")
-    assert not d["require_encryption"]
-    ctx = d["ssl_context"]
-    basic_checks(ctx)
-    many_ciphers(ctx)
-
-    d = sec.get_listen_args("worker")
-    ctx = d["ssl_context"]
-    basic_checks(ctx)
-    many_ciphers(ctx)
+    for role in ("scheduler", "worker"):
+        d = get_args(sec, role)
+        assert not d["require_encryption"]
+        ctx = d["ssl_context"]
+        basic_checks(ctx)
+        many_ciphers(ctx)
 
     # No cert defined => no TLS
-    d = sec.get_listen_args("client")
+    d = get_args(sec, "client")
     assert d.get("ssl_context") is None
 
     # With more settings
-    c["distributed.comm.tls.ciphers"] = FORCED_CIPHER
-    c["distributed.comm.require-encryption"] = True
-
-    with dask.config.set(c):
-        sec = Security()
+    sec = Security(
+        tls_ca_file=ca_file,
+        tls_scheduler_key=key1,
+        tls_scheduler_cert=cert1,
+        tls_worker_cert=keycert1,
+        tls_ciphers=FORCED_CIPHER,
+        require_encryption=True,
+    )
 
-    d = sec.get_listen_args("scheduler")
+    d = get_args(sec, "scheduler")
     assert d["require_encryption"]
-    ctx = d["ssl_context"]
-    basic_checks(ctx)
-    if sys.version_info >= (3, 6):
-        supported_ciphers = ctx.get_ciphers()
-        tls_12_ciphers = [c for c in supported_ciphers if c["protocol"] == "TLSv1.2"]
-        assert len(tls_12_ciphers) == 1
-        tls_13_ciphers = [c for c in supported_ciphers if c["protocol"] == "TLSv1.3"]
-        if len(tls_13_ciphers):
-            assert len(tls_13_ciphers) == 3
+    forced_cipher_checks(d["ssl_context"])
+
+
+def test_connection_args():
+    check_tls_args(Security.get_connection_args)
+
+
+def test_listen_args():
+    check_tls_args(Security.get_listen_args)
+
+
+def test_tls_context_reused():
+    sec = Security(
+        tls_ca_file=ca_file, tls_scheduler_cert=cert1, tls_scheduler_key=key1
+    )
+    ctx = sec.get_connection_args("scheduler")["ssl_context"]
+    assert sec.get_connection_args("scheduler")["ssl_context"] is ctx
+
+    sec2 = Security(
+        tls_ca_file=ca_file, tls_scheduler_cert=cert1, tls_scheduler_key=key1
+    )
+    assert sec2.get_connection_args("scheduler")["ssl_context"] is ctx
+
+    # Server side contexts are configured differently
+    assert sec.get_listen_args("scheduler")["ssl_context"] is not ctx
+
+    sec3 = Security(
+        tls_ca_file=ca_file,
+        tls_scheduler_cert=cert1,
+        tls_scheduler_key=key1,
+        tls_ciphers=FORCED_CIPHER,
+    )
+    assert sec3.get_connection_args("scheduler")["ssl_context"] is not ctx
 
 
 @gen_test()
@@ -271,18 +253,16 @@ def test_tls_listen_connect():
         yield comm.write("hello")
         yield comm.close()
 
-    c = {
-        "distributed.comm.tls.ca-file": ca_file,
-        "distributed.comm.tls.scheduler.key": key1,
-        "distributed.comm.tls.scheduler.cert": cert1,
-        "distributed.comm.tls.worker.cert": keycert1,
-    }
-    with dask.config.set(c):
+    with dask.config.set(CERTS_CONFIG):
         sec = Security()
 
-    c["distributed.comm.tls.ciphers"] = FORCED_CIPHER
-    with dask.config.set(c):
-        forced_cipher_sec = Security()
+    forced_cipher_sec = Security(
+        tls_ca_file=ca_file,
+        tls_scheduler_key=key1,
+        tls_scheduler_cert=cert1,
+        tls_worker_cert=keycert1,
+        tls_ciphers=FORCED_CIPHER,
+    )
 
     with listen(
         "tls://", handle_comm, connection_args=sec.get_listen_args("scheduler")
@@ -307,7 +287,7 @@ def test_tls_listen_connect():
             connection_args=forced_cipher_sec.get_connection_args("worker"),
         )
         cipher, _, _, = comm.extra_info["cipher"]
-        assert cipher in [FORCED_CIPHER] + TLS_13_CIPHERS
+        assert cipher in _ACCEPTED_CIPHERS
         comm.abort()
 
 
@@ -321,29 +301,31 @@ def test_require_encryption():
     def handle_comm(comm):
         comm.abort()
 
-    c = {
-        "distributed.comm.tls.ca-file": ca_file,
-        "distributed.comm.tls.scheduler.key": key1,
-        "distributed.comm.tls.scheduler.cert": cert1,
-        "distributed.comm.tls.worker.cert": keycert1,
-    }
-    with dask.config.set(c):
+    with dask.config.set(CERTS_CONFIG):
         sec = Security()
 
-    c["distributed.comm.require-encryption"] = True
-    with dask.config.set(c):
-        sec2 = Security()
+    sec2 = Security(
+        tls_ca_file=ca_file,
+        tls_scheduler_key=key1,
+        tls_scheduler_cert=cert1,
+        tls_worker_cert=keycert1,
+        require_encryption=True,
+    )
 
-    for listen_addr in ["inproc://", "tls://"]:
-        with listen(
-            listen_addr, handle_comm, connection_args=sec.get_listen_args("scheduler")
-        ) as listener:
-            comm = yield connect(
-                listener.contact_address,
-                connection_args=sec2.get_connection_args("worker"),
-            )
-            comm.abort()
+    assert sec2.get_listen_args("scheduler")["require_encryption"]
+    assert sec2.get_connection_args("worker")["require_encryption"]
 
+    # A listener's own require_encryption setting is only consulted by
+    # listen(), so a TLS handshake against it would repeat the one below
+    with listen(
+        "inproc://", handle_comm, connection_args=sec.get_listen_args("scheduler")
+    ) as listener:
+        comm = yield connect(
+            listener.contact_address, connection_args=sec2.get_connection_args("worker")
+        )
+        comm.abort()
+
+    for listen_addr in ["inproc://", "tls://"]:
         with listen(
             listen_addr, handle_comm, connection_args=sec2.get_listen_args("scheduler")
         ) as listener:
@@ -2,11 +2,10 @@ from __future__ import print_function, division, absolute_import
 
 import asyncio
 from collections import defaultdict
-from itertools import cycle
+from itertools import chain, cycle, islice
 import random
 
 from dask.optimization import SubgraphCallable
-from toolz import merge, concat, groupby, drop
 
 from .core import rpc
 from .utils import All, tokey
@@ -30,10 +29,9 @@ async def gather_from_workers(who_has, rpc, close=True, serializers=None, who=No
     """
     from .worker import get_data_from_worker
 
-    bad_addresses = set()
     missing_workers = set()
     original_who_has = who_has
-    who_has = {k: set(v) for k, v in who_has.items()}
+    who_has = {k: list(set(v)) for k, v in who_has.items()}
     results = dict()
     all_bad_keys = set()
 
@@ -45,7 +43,7 @@ async def gather_from_workers(who_has, rpc, close=True, serializers=None, who=No
             if key in results:
                 continue
             try:
-                addr = random.choice(list(addresses - bad_addresses))
+                addr = random.choice(addresses)
                 d[addr].append(key)
                 rev[key] = addr
             except IndexError:
@@ -53,35 +51,37 @@ async def gather_from_workers(who_has, rpc, close=True, serializers=None, who=No
         if bad_keys:
             all_bad_keys |= bad_keys
 
-        rpcs = {addr: rpc(addr) for addr in d}
-        try:
-            coroutines = {
-                address: asyncio.ensure_future(
-                    get_data_from_worker(
-                        rpc,
-                        keys,
-                        address,
-                        who=who,
-                        serializers=serializers,
-                        max_connections=False,
-                    )
+        responses = await asyncio.gather(
+            *(
+                get_data_from_worker(
+                    rpc,
+                    keys,
+                    address,
+                    who=who,
+                    serializers=serializers,
+                    max_connections=False,
                 )
                 for address, keys in d.items()
-            }
-            response = {}
-            for worker, c in coroutines.items():
-                try:
-                    r = await c
-                except EnvironmentError:
-                    missing_workers.add(worker)
-                else:
-                    response.update(r["data"])
-        finally:
-            for r in rpcs.values():
-                r.close_rpc()
-
-        bad_addresses |= {v for k, v in rev.items() if k not in response}
-        results.update(response)
+            ),
+            return_exceptions=True
+        )
+        for worker, r in zip(d, responses):
+            if isinstance(r, EnvironmentError):
+                missing_workers.add(worker)
+            elif isinstance(r, BaseException):
+                raise r
+            else:
+                results.update(r["data"])
+
+        # rev only holds keys that were still outstanding this round
+        bad_addresses = {v for k, v in rev.items() if k not in results}
+
+        # Drop failed workers once here, rather than filtering every key's
+        # candidates on each attempt
+        if bad_addresses:
+            for key, addresses in who_has.items():
+                if key not in results:
+                    who_has[key] = [a for a in addresses if a not in bad_addresses]
 
     bad_keys = {k: list(original_who_has[k]) for k in all_bad_keys}
     return (results, bad_keys, list(missing_workers))
@@ -98,6 +98,8 @@ class WrappedKey(object):
     that can only be addressed by additional metadata.
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key):
         self.key = key
 
@@ -120,15 +122,18 @@ async def scatter_to_workers(nthreads, data, rpc=rpc, report=True, serializers=N
     assert isinstance(nthreads, dict)
     assert isinstance(data, dict)
 
-    workers = list(concat([w] * nc for w, nc in nthreads.items()))
-    names, data = list(zip(*data.items()))
+    workers = list(chain.from_iterable([w] * nc for w, nc in nthreads.items()))
+    names = tuple(data)
 
-    worker_iter = drop(_round_robin_counter[0] % len(workers), cycle(workers))
+    worker_iter = islice(cycle(workers), _round_robin_counter[0] % len(workers), None)
     _round_robin_counter[0] += len(data)
 
-    L = list(zip(worker_iter, names, data))
-    d = groupby(0, L)
-    d = {worker: {key: value for _, key, value in v} for worker, v in d.items()}
+    # Keys come from a dict, so each is sent to exactly one worker
+    d = defaultdict(dict)
+    who_has = {}
+    for worker, (key, value) in zip(worker_iter, data.items()):
+        d[worker][key] = value
+        who_has[key] = [worker]
 
     rpcs = {addr: rpc(addr) for addr in d}
     try:
@@ -144,15 +149,33 @@ async def scatter_to_workers(nthreads, data, rpc=rpc, report=True, serializers=N
         for r in rpcs.values():
             r.close_rpc()
 
-    nbytes = merge(o["nbytes"] for o in out)
-
-    who_has = {k: [w for w, _, _ in v] for k, v in groupby(1, L).items()}
+    nbytes = {}
+    for o in out:
+        nbytes.update(o["nbytes"])
 
     return (names, who_has, nbytes)
 
 
 collection_types = (tuple, list, set, frozenset)
 
+# Types that unpack_remotedata has to descend into.  Any other object is
+# returned unchanged unless it is a WrappedKey.
+_unpack_types = frozenset(collection_types + (dict,))
+
+
+def _unpack_items(items, byte_keys, myset):
+    """ Unpack each of ``items``, only recursing into items that need it
+
+    Most items in a task are plain values, so checking them here rather than
+    in a recursive call saves a Python frame per item.
+    """
+    return [
+        unpack_remotedata(item, byte_keys, myset)
+        if type(item) in _unpack_types or isinstance(item, WrappedKey)
+        else item
+        for item in items
+    ]
+
 
 def unpack_remotedata(o, byte_keys=False, myset=None):
     """ Unpack WrappedKey objects from collection
@@ -183,6 +206,8 @@ def unpack_remotedata(o, byte_keys=False, myset=None):
     """
     if myset is None:
         myset = set()
+        if type(o) not in _unpack_types and not isinstance(o, WrappedKey):
+            return o, myset
         out = unpack_remotedata(o, byte_keys, myset)
         return out, myset
 
@@ -194,10 +219,10 @@ def unpack_remotedata(o, byte_keys=False, myset=None):
         if type(o[0]) is SubgraphCallable:
             sc = o[0]
             futures = set()
-            dsk = {
-                k: unpack_remotedata(v, byte_keys, futures) for k, v in sc.dsk.items()
-            }
-            args = tuple(unpack_remotedata(i, byte_keys, futures) for i in o[1:])
+            dsk = dict(
+                zip(sc.dsk.keys(), _unpack_items(sc.dsk.values(), byte_keys, futures))
+            )
+            args = tuple(_unpack_items(o[1:], byte_keys, futures))
             if futures:
                 myset.update(futures)
                 futures = (
@@ -214,16 +239,18 @@ def unpack_remotedata(o, byte_keys=False, myset=None):
             else:
                 return o
         else:
-            return tuple(unpack_remotedata(item, byte_keys, myset) for item in o)
+            return tuple(_unpack_items(o, byte_keys, myset))
+    if typ is list:
+        if not o:
+            return o
+        return _unpack_items(o, byte_keys, myset)
     if typ in collection_types:
         if not o:
             return o
-        outs = [unpack_remotedata(item, byte_keys, myset) for item in o]
-        return typ(outs)
+        return typ(_unpack_items(o, byte_keys, myset))
     elif typ is dict:
         if o:
-            values = [unpack_remotedata(v, byte_keys, myset) for v in o.values()]
-            return dict(zip(o.keys(), values))
+            return dict(zip(o.keys(), _unpack_items(o.values(), byte_keys, myset)))
         else:
             return o
     elif issubclass(typ, WrappedKey):  # TODO use type is Future
@@ -236,6 +263,12 @@ def unpack_remotedata(o, byte_keys=False, myset=None):
         return o
 
 
+# Containers that can never be keys, so pack_data skips looking them up
+_unhashable_types = frozenset((list, set, dict))
+
+_missing = object()
+
+
 def pack_data(o, d, key_types=object):
     """ Merge known data into tuple or dict
 
@@ -257,13 +290,18 @@ def pack_data(o, d, key_types=object):
     {'a': [1], 'b': 'y'}
     """
     typ = type(o)
-    try:
-        if isinstance(o, key_types) and o in d:
-            return d[o]
-    except TypeError:
-        pass
+    if typ not in _unhashable_types and isinstance(o, key_types):
+        try:
+            v = d.get(o, _missing)
+        except TypeError:
+            pass
+        else:
+            if v is not _missing:
+                return v
 
-    if typ in collection_types:
+    if typ is list:
+        return [pack_data(x, d, key_types=key_types) for x in o]
+    elif typ in collection_types:
         return typ([pack_data(x, d, key_types=key_types) for x in o])
     elif typ is dict:
         return {k: pack_data(v, d, key_types=key_types) for k, v in o.items()}
@@ -1067,13 +1067,18 @@ def wait_for(predicate, timeout, fail_func=None, period=0.001):
 
 
 async def async_wait_for(predicate, timeout, fail_func=None, period=0.001):
-    deadline = time() + timeout
-    while not predicate():
-        await gen.sleep(period)
-        if time() > deadline:
-            if fail_func is not None:
-                fail_func()
-            pytest.fail("condition not reached until %s seconds" % (timeout,))
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(period)
+
+    # Let the event loop own the deadline rather than checking the clock
+    # on every polling tick
+    try:
+        await asyncio.wait_for(poll(), timeout)
+    except asyncio.TimeoutError:
+        if fail_func is not None:
+            fail_func()
+        pytest.fail("condition not reached until %s seconds" % (timeout,))
 
 
 @memoize
@@ -1316,6 +1321,7 @@ def new_config_file(c):
 certs_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "tests"))
 
 
+@memoize
 def get_cert(filename):
     """
     Get the path to one of the test TLS certificates.